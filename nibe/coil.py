@@ -1,9 +1,13 @@
-from typing import Dict, Optional, Union
+import sys
+from functools import lru_cache
+from struct import Struct
+from struct import error as StructError
+from types import MappingProxyType
+from typing import Callable, Dict, Optional, Tuple, Union
 
-from construct import (ConstructError, Int8sl, Int8ul, Int16sl, Int16ul, Int32sl,
-                       Int32ul, Padded,)
+from construct import Int8sl, Int8ul, Int16sl, Int16ul, Int32sl, Int32ul
 
-from nibe.exceptions import DecodeException, EncodeException
+from nibe.exceptions import DecodeException, EncodeException, ValidationException
 
 parser_map = {
     "u8": Int8ul,
@@ -14,6 +18,36 @@ parser_map = {
     "s32": Int32sl,
 }
 
+struct_map = {
+    "u8": Struct("<B"),
+    "u16": Struct("<H"),
+    "u32": Struct("<I"),
+    "s8": Struct("<b"),
+    "s16": Struct("<h"),
+    "s32": Struct("<i"),
+}
+
+_EMPTY_OTHER = MappingProxyType({})
+
+_BOOLEAN_MAPPINGS = {"0": "OFF", "1": "ON"}
+_BOOLEAN_KEYS = frozenset(_BOOLEAN_MAPPINGS)
+
+
+@lru_cache(maxsize=256)
+def _build_mappings(items: Tuple[Tuple[str, str], ...]):
+    """Build read-only mapping tables, shared between coils with equal mappings."""
+    mappings = dict((k, v.upper()) for k, v in items)
+    reverse_mappings = dict((v.upper(), k) for k, v in items)
+    mappings_int = dict((int(k), v) for k, v in mappings.items())
+    reverse_mappings_int = dict((k, int(v)) for k, v in reverse_mappings.items())
+
+    return (
+        MappingProxyType(mappings),
+        MappingProxyType(reverse_mappings),
+        MappingProxyType(mappings_int),
+        MappingProxyType(reverse_mappings_int),
+    )
+
 
 def is_coil_boolean(coil):
     if coil.factor != 1:
@@ -22,13 +56,41 @@ def is_coil_boolean(coil):
     if coil.min == 0 and coil.max == 1:
         return True
 
-    if coil.mappings and all(k in ["0", "1"] for k in coil.mappings):
+    if coil.mappings and coil.mappings.keys() <= _BOOLEAN_KEYS:
         return True
 
     return False
 
 
 class Coil:
+    __slots__ = (
+        "parser",
+        "_struct",
+        "_padding",
+        "address",
+        "name",
+        "title",
+        "size",
+        "factor",
+        "mappings",
+        "reverse_mappings",
+        "info",
+        "unit",
+        "is_writable",
+        "other",
+        "raw_min",
+        "raw_max",
+        "min",
+        "max",
+        "is_boolean",
+        "_value",
+        "_convert",
+        "_unconvert",
+        "_mappings_int",
+        "_reverse_mappings_int",
+        "_has_raw_bounds",
+    )
+
     mappings: Optional[Dict[str, str]]
     reverse_mappings: Optional[Dict[str, str]]
 
@@ -53,21 +115,26 @@ class Coil:
             mappings is not None and factor != 1
         ), "When mapping is used factor needs to be 1"
 
-        self.parser = parser_map.get(size)
-        assert self.parser is not None
+        try:
+            self.parser = parser_map[size]
+            self._struct = struct_map[size]
+        except KeyError:
+            raise ValueError(f"Unsupported size '{size}' for {name}")
+        self._padding = bytes(4 - self._struct.size)
 
         self.address = address
-        self.name = name
-        self.title = title
+        self.name = sys.intern(name)
+        self.title = sys.intern(title)
+        self.size = size
         self.factor = factor
 
         self.set_mappings(mappings)
 
         self.info = info
-        self.unit = unit
+        self.unit = sys.intern(unit) if unit is not None else None
         self.is_writable = write
 
-        self.other = kwargs
+        self.other = kwargs or _EMPTY_OTHER
 
         self.raw_min = self.other.get("min")
         self.raw_max = self.other.get("max")
@@ -75,19 +142,79 @@ class Coil:
         self.min = self.raw_min / factor if self.raw_min is not None else None
         self.max = self.raw_max / factor if self.raw_max is not None else None
 
+        self._has_raw_bounds = self.raw_min is not None or self.raw_max is not None
+
         self.is_boolean = is_coil_boolean(self)
         if self.is_boolean and not mappings:
-            self.set_mappings({"0": "OFF", "1": "ON"})
+            self.set_mappings(_BOOLEAN_MAPPINGS)
 
         self._value = None
 
     def set_mappings(self, mappings):
         if mappings:
-            self.mappings = dict((k, v.upper()) for k, v in mappings.items())
-            self.reverse_mappings = dict((v.upper(), k) for k, v in mappings.items())
+            (
+                mappings,
+                reverse_mappings,
+                self._mappings_int,
+                self._reverse_mappings_int,
+            ) = _build_mappings(tuple(mappings.items()))
+            self.mappings = dict(mappings)
+            self.reverse_mappings = dict(reverse_mappings)
         else:
             self.mappings = None
             self.reverse_mappings = None
+            self._mappings_int = None
+            self._reverse_mappings_int = None
+
+        self._convert, self._unconvert = self._build_converters()
+
+    def _build_converters(
+        self,
+    ) -> Tuple[
+        Callable[["Coil", int], Union[int, float, str]],
+        Callable[["Coil", Union[int, float, str]], int],
+    ]:
+        # Unbound functions, so a coil does not reference itself through them
+        if self.mappings is not None:
+            return Coil._get_mapping_for, Coil._get_reverse_mapping_for
+
+        if self.factor != 1:
+            return Coil._scale, Coil._unscale
+
+        return Coil._identity, Coil._check
+
+    def _identity(self, value: int) -> int:
+        return value
+
+    def _check(self, value: Union[int, float]) -> Union[int, float]:
+        self._check_raw_value_bounds(value)
+        return value
+
+    def _scale(self, value: int) -> float:
+        return value / self.factor
+
+    def _unscale(self, value: Union[int, float]) -> int:
+        raw_value = round(value * self.factor)
+        self._check_raw_value_bounds(raw_value)
+        return raw_value
+
+    def _get_mapping_for(self, value: int) -> str:
+        mapped_value = self._mappings_int.get(value)
+        if mapped_value is None:
+            raise DecodeException(
+                f"Mapping not found for {self.name} coil for value: {value}"
+            )
+
+        return mapped_value
+
+    def _get_reverse_mapping_for(self, value: str) -> int:
+        mapped_value = self._reverse_mappings_int.get(value)
+        if mapped_value is None:
+            raise EncodeException(
+                f"Mapping not found for {self.name} coil for value: {value}"
+            )
+
+        return mapped_value
 
     @property
     def value(self) -> Union[int, float, str]:
@@ -97,16 +224,18 @@ class Coil:
     def value(self, value: Union[int, float, str]):
         if self.mappings:
             value = value.upper()
-            assert (
-                value in self.reverse_mappings
-            ), f"Provided value '{value}' is not in {self.reverse_mappings.keys()} for {self.name}"
+            if value not in self.reverse_mappings:
+                raise ValidationException(
+                    f"Provided value '{value}' is not in {self.reverse_mappings.keys()} for {self.name}"
+                )
 
             self._value = value
             return
 
-        assert isinstance(
-            value, (int, float)
-        ), f"Provided value '{value}' is invalid type (int and float are supported) for {self.name}"
+        if not isinstance(value, (int, float)):
+            raise ValidationException(
+                f"Provided value '{value}' is invalid type (int and float are supported) for {self.name}"
+            )
 
         self.check_value_bounds(value)
 
@@ -118,75 +247,83 @@ class Coil:
 
     @raw_value.setter
     def raw_value(self, raw_value: bytes):
-        self.value = self._decode(raw_value)
+        # _decode already validated bounds and mapping
+        self._value = self._decode(raw_value)
 
     def _decode(self, raw: bytes) -> Union[int, float, str]:
-        value = self.parser.parse(raw)
         try:
-            self._check_raw_value_bounds(value)
-        except AssertionError as e:
+            value = self._struct.unpack_from(raw)[0]
+            if self._has_raw_bounds:
+                self._check_raw_value_bounds(value)
+        except ValidationException as e:
             raise DecodeException(e)
-        if self.factor != 1:
-            value /= self.factor
-        if self.mappings is None:
-            return value
-
-        mapped_value = self.mappings.get(str(value))
-        if mapped_value is None:
+        except StructError as e:
             raise DecodeException(
-                f"Mapping not found for {self.name} coil for value: {value}"
+                f"Failed to decode {self.name} coil from raw: {raw.hex()}, exception: {e}"
             )
 
-        return mapped_value
+        return self._convert(self, value)
 
     def _encode(self, val: Union[int, float, str]) -> bytes:
         try:
-            if self.reverse_mappings is not None:
-                mapped_value = self.reverse_mappings.get(str(val))
-                if mapped_value is None:
-                    raise EncodeException(
-                        f"Mapping not found for {self.name} coil for value: {val}"
-                    )
-
-                return self._pad(mapped_value)
-
-            if self.factor != 1:
-                val *= self.factor
-
-            self._check_raw_value_bounds(val)
-
-            return self._pad(val)
-        except AssertionError as e:
+            return self._pad(self._unconvert(self, val))
+        except ValidationException as e:
             raise EncodeException(e)
-        except ConstructError as e:
+        except StructError as e:
             raise EncodeException(
                 f"Failed to encode {self.name} coil for value: {val}, exception: {e}"
             )
 
     def _pad(self, value) -> bytes:
-        return Padded(4, self.parser).build(int(value))
+        return self._struct.pack(int(value)) + self._padding
 
     def check_value_bounds(self, value):
-        if self.min is not None:
-            assert (
-                value >= self.min
-            ), f"{self.name} coil value is smaller than min({self.min}) allowed"
+        min_value = self.min
+        if min_value is not None and value < min_value:
+            raise ValidationException(
+                f"{self.name} coil value is smaller than min({min_value}) allowed"
+            )
 
-        if self.max is not None:
-            assert (
-                value <= self.max
-            ), f"{self.name} coil value is larger than max({self.max}) allowed"
+        max_value = self.max
+        if max_value is not None and value > max_value:
+            raise ValidationException(
+                f"{self.name} coil value is larger than max({max_value}) allowed"
+            )
 
     def _check_raw_value_bounds(self, value):
-        if self.raw_min is not None:
-            assert (
-                value >= self.raw_min
-            ), f"{self.name} coil raw value is smaller than min({self.raw_min}) allowed"
+        raw_min = self.raw_min
+        if raw_min is not None and value < raw_min:
+            raise ValidationException(
+                f"{self.name} coil raw value is smaller than min({raw_min}) allowed"
+            )
+
+        raw_max = self.raw_max
+        if raw_max is not None and value > raw_max:
+            raise ValidationException(
+                f"{self.name} coil raw value is larger than max({raw_max}) allowed"
+            )
 
-        if self.raw_max is not None:
-            assert (
-                value <= self.raw_max
-            ), f"{self.name} coil raw value is larger than max({self.raw_max}) allowed"
+    def __reduce__(self):
+        # struct.Struct cannot be pickled, so rebuild the coil from its definition
+        definition = dict(
+            self.other,
+            address=self.address,
+            name=self.name,
+            title=self.title,
+            size=self.size,
+            factor=self.factor,
+            info=self.info,
+            unit=self.unit,
+            mappings=self.mappings,
+            write=self.is_writable,
+        )
+        return _restore_coil, (definition, self._value)
 
     def __repr__(self):
         return f"Coil {self.address}, name: {self.name}, title: {self.title}, value: {self.value}"
+
+
+def _restore_coil(definition: dict, value) -> Coil:
+    coil = Coil(**definition)
+    coil._value = value
+    return coil
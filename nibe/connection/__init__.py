@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, List
 
 from nibe.coil import Coil
 
@@ -16,6 +17,11 @@ class Connection(ABC):
     async def read_coil(self, coil: Coil, timeout: float = DEFAULT_TIMEOUT) -> Coil:
         pass
 
+    async def read_coils(
+        self, coils: Iterable[Coil], timeout: float = DEFAULT_TIMEOUT
+    ) -> List[Coil]:
+        return [await self.read_coil(coil, timeout) for coil in coils]
+
     @abstractmethod
     async def write_coil(self, coil: Coil, timeout: float = DEFAULT_TIMEOUT) -> Coil:
         pass
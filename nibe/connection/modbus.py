@@ -1,15 +1,57 @@
 import asyncio
 import logging
+from operator import attrgetter
+from struct import Struct
+from typing import Iterable, List
 
 from async_modbus import modbus_for_url
 
-from nibe.coil import Coil
+from nibe.coil import Coil, struct_map
 from nibe.connection import Connection
 from nibe.exceptions import CoilReadException, CoilWriteException, DecodeException
 from nibe.heatpump import HeatPump
 
 logger = logging.getLogger("nibe").getChild(__name__)
 
+register_struct_map = {
+    1: Struct("<H"),
+    2: Struct("<HH"),
+}
+
+
+register_count_map = {
+    "u8": 1,
+    "u16": 1,
+    "u32": 2,
+    "s8": 1,
+    "s16": 1,
+    "s32": 2,
+}
+
+MAX_REGISTERS_PER_READ = 125
+
+
+def get_register_count(coil: Coil) -> int:
+    return register_count_map[coil.size]
+
+
+def split_read_blocks(coils: Iterable[Coil]) -> List[List[Coil]]:
+    blocks = []
+    block_end = None
+    for coil in sorted(coils, key=attrgetter("address")):
+        register_count = get_register_count(coil)
+        if (
+            coil.address == block_end
+            and block_end + register_count - blocks[-1][0].address
+            <= MAX_REGISTERS_PER_READ
+        ):
+            blocks[-1].append(coil)
+        else:
+            blocks.append([coil])
+        block_end = coil.address + register_count
+
+    return blocks
+
 
 class Modbus(Connection):
     DEFAULT_TIMEOUT = 5
@@ -19,45 +61,106 @@ class Modbus(Connection):
         self._heatpump = heatpump
         self._client = modbus_for_url(url, conn_options)
 
+        self._send_lock = asyncio.Lock()
+
     async def read_coil(self, coil: Coil, timeout: float = DEFAULT_TIMEOUT) -> Coil:
-        logger.debug(f"Sending read request")
-        try:
-            result = await asyncio.wait_for(
-                self._client.read_input_registers(
-                    slave_id=self._slave_id, starting_address=coil.address, quantity=1
-                ),
-                timeout,
-            )
-            coil.raw_value = result[0]
-            logger.info(f"{coil.name}: {coil.value}")
-            self._heatpump.notify_coil_update(coil)
-        except asyncio.TimeoutError:
-            raise CoilReadException(
-                f"Timeout waiting for read response for {coil.name}"
-            )
+        await self._read_block([coil], timeout)
 
         return coil
 
+    async def read_coils(
+        self, coils: Iterable[Coil], timeout: float = DEFAULT_TIMEOUT
+    ) -> List[Coil]:
+        coils = list(coils)
+        errors = []
+        for block in split_read_blocks(coils):
+            try:
+                await self._read_block(block, timeout)
+            except DecodeException as e:
+                errors.append(e)
+
+        if errors:
+            raise DecodeException("; ".join(str(e) for e in errors))
+
+        return coils
+
+    async def _read_block(self, coils: List[Coil], timeout: float):
+        starting_address = coils[0].address
+        quantity = coils[-1].address + get_register_count(coils[-1]) - starting_address
+
+        async with self._send_lock:
+            logger.debug("Sending read request")
+            try:
+                result = await asyncio.wait_for(
+                    self._client.read_input_registers(
+                        slave_id=self._slave_id,
+                        starting_address=starting_address,
+                        quantity=quantity,
+                    ),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                names = ", ".join(coil.name for coil in coils)
+                raise CoilReadException(
+                    f"Timeout waiting for read response for {names}"
+                )
+
+        errors = []
+        for coil in coils:
+            offset = coil.address - starting_address
+            register_count = get_register_count(coil)
+            try:
+                coil.raw_value = register_struct_map[register_count].pack(
+                    *result[offset : offset + register_count]
+                )
+            except DecodeException as e:
+                errors.append(e)
+                continue
+
+            logger.info("%s: %s", coil.name, coil.value)
+            self._heatpump.notify_coil_update(coil)
+
+        if errors:
+            raise DecodeException("; ".join(str(e) for e in errors))
+
     async def write_coil(self, coil: Coil, timeout: float = DEFAULT_TIMEOUT) -> Coil:
         assert coil.is_writable, f"{coil.name} is not writable"
         assert coil.value is not None
 
-        logger.debug(f"Sending write request")
-        try:
-            result = await asyncio.wait_for(
-                self._client.write_register(
-                    slave_id=self._slave_id, address=coil.address, value=coil.raw_value
-                ),
-                timeout,
+        register_count = get_register_count(coil)
+        if register_count == 1:
+            # sign-extend s8/s16 into the 16-bit register
+            value = struct_map[coil.size].unpack_from(coil.raw_value)[0]
+            registers = (value & 0xFFFF,)
+        else:
+            registers = register_struct_map[register_count].unpack_from(
+                coil.raw_value
             )
 
-            if not result:
-                raise CoilWriteException(f"Heatpump denied writing {coil.name}")
-            else:
-                logger.info(f"Write succeeded for {coil.name}")
-        except asyncio.TimeoutError:
-            raise CoilWriteException(
-                f"Timeout waiting for write feedback for {coil.name}"
-            )
+        async with self._send_lock:
+            logger.debug("Sending write request")
+            try:
+                if len(registers) == 1:
+                    request = self._client.write_register(
+                        slave_id=self._slave_id,
+                        address=coil.address,
+                        value=registers[0],
+                    )
+                else:
+                    request = self._client.write_registers(
+                        slave_id=self._slave_id,
+                        starting_address=coil.address,
+                        values=registers,
+                    )
+                result = await asyncio.wait_for(request, timeout)
+
+                if not result:
+                    raise CoilWriteException(f"Heatpump denied writing {coil.name}")
+                else:
+                    logger.info("Write succeeded for %s", coil.name)
+            except asyncio.TimeoutError:
+                raise CoilWriteException(
+                    f"Timeout waiting for write feedback for {coil.name}"
+                )
 
         return coil
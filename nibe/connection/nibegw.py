@@ -2,21 +2,21 @@ import asyncio
 import logging
 import socket
 from asyncio import CancelledError, InvalidStateError
-from binascii import hexlify
 from contextlib import suppress
-from functools import reduce
+from functools import lru_cache, reduce
 from io import BytesIO
 from operator import xor
+from struct import Struct as PyStruct
 
-from construct import (Array, Bytes, Checksum, ChecksumError, Const, Enum, FixedSized,
-                       Flag, Int8ub, Int16ul, RawCopy, Struct, Subconstruct, Switch,
-                       this,)
+from construct import (Adapter, Bytes, Checksum, ChecksumError, Const, Container, Enum,
+                       FixedSized, Flag, GreedyBytes, Int8ub, Int16ul, ListContainer,
+                       RawCopy, Struct, Subconstruct, Switch, this,)
 
 from nibe.coil import Coil
 from nibe.connection import Connection
-from nibe.exceptions import (CoilNotFoundException, CoilReadException,
-                             CoilReadTimeoutException, CoilWriteException,
-                             CoilWriteTimeoutException, DecodeException, NibeException,)
+from nibe.exceptions import (CoilReadException, CoilReadTimeoutException,
+                             CoilWriteException, CoilWriteTimeoutException,
+                             DecodeException, NibeException,)
 from nibe.heatpump import HeatPump
 
 logger = logging.getLogger("nibe").getChild(__name__)
@@ -48,6 +48,12 @@ class NibeGW(asyncio.DatagramProtocol, Connection):
         self._write_future = None
         self._read_future = None
 
+        self._command_handlers = {
+            "MODBUS_DATA_MSG": self._on_modbus_data_msg,
+            "MODBUS_READ_RESP": self._on_modbus_read_resp,
+            "MODBUS_WRITE_RESP": self._on_modbus_write_resp,
+        }
+
     async def start(self):
         logger.info(f"Starting UDP server on port {self._listening_port}")
 
@@ -61,57 +67,40 @@ class NibeGW(asyncio.DatagramProtocol, Connection):
         self._transport = transport
 
     def datagram_received(self, data, addr):
-        logger.debug(f"Received {hexlify(data)} from {addr}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Received {data.hex()} from {addr}")
         try:
             msg = Response.parse(data)
             logger.debug(msg)
             cmd = msg.fields.value.cmd
-            if cmd == "MODBUS_DATA_MSG":
-                for row in msg.fields.value.data:
-                    try:
-                        self._on_raw_coil_value(row.coil_address, row.value)
-                    except NibeException as e:
-                        logger.error(str(e))
-            elif cmd == "MODBUS_READ_RESP":
-                row = msg.fields.value.data
-                try:
-                    self._on_raw_coil_value(row.coil_address, row.value)
-                    with suppress(InvalidStateError, CancelledError, AttributeError):
-                        self._read_future.set_result(None)
-                except NibeException as e:
-                    with suppress(InvalidStateError, CancelledError, AttributeError):
-                        self._read_future.set_exception(CoilReadException(str(e), e))
-                    raise
-            elif cmd == "MODBUS_WRITE_RESP":
-                with suppress(InvalidStateError, CancelledError, AttributeError):
-                    self._write_future.set_result(msg.fields.value.data.result)
+            handler = self._command_handlers.get(cmd)
+            if handler is None:
+                logger.debug("Unknown command %s", cmd)
             else:
-                logger.debug(f"Unknown command {cmd}")
+                handler(msg.fields.value.data)
         except ChecksumError:
             logger.warning(
-                f"Ignoring packet from {addr} due to checksum error: {hexlify(data)}"
+                f"Ignoring packet from {addr} due to checksum error: {data.hex()}"
             )
         except NibeException as e:
             logger.error(f"Failed handling packet from {addr}: {e}")
-        except Exception as e:
+        except Exception:
             logger.exception(
-                f"Unexpected exception during parsing packet data '{hexlify(data)}' from {addr}",
-                e,
+                f"Unexpected exception during parsing packet data '{data.hex()}' from {addr}"
             )
 
     async def read_coil(self, coil: Coil, timeout: float = DEFAULT_TIMEOUT) -> Coil:
         async with self._send_lock:
-            data = ReadRequest.build(
-                dict(fields=dict(value=dict(coil_address=coil.address)))
-            )
+            data = build_read_request(coil.address)
 
             self._read_future = asyncio.get_event_loop().create_future()
 
-            logger.debug(
-                f"Sending {hexlify(data)} (read request) to {self._remote_ip}:{self._remote_write_port}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Sending {data.hex()} (read request) to {self._remote_ip}:{self._remote_read_port}"
+                )
             self._transport.sendto(data, (self._remote_ip, self._remote_read_port))
-            logger.debug(f"Waiting for read response for {coil.name}")
+            logger.debug("Waiting for read response for %s", coil.name)
 
             try:
                 await asyncio.wait_for(self._read_future, timeout)
@@ -128,19 +117,14 @@ class NibeGW(asyncio.DatagramProtocol, Connection):
         assert coil.is_writable, f"{coil.name} is not writable"
         assert coil.value is not None
         async with self._send_lock:
-            data = WriteRequest.build(
-                dict(
-                    fields=dict(
-                        value=dict(coil_address=coil.address, value=coil.raw_value)
-                    )
-                )
-            )
+            data = build_write_request(coil.address, coil.raw_value)
 
             self._write_future = asyncio.get_event_loop().create_future()
 
-            logger.debug(
-                f"Sending {hexlify(data)} (write request) to {self._remote_ip}:{self._remote_write_port}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Sending {data.hex()} (write request) to {self._remote_ip}:{self._remote_write_port}"
+                )
             self._transport.sendto(data, (self._remote_ip, self._remote_write_port))
 
             try:
@@ -151,7 +135,7 @@ class NibeGW(asyncio.DatagramProtocol, Connection):
                 if not result:
                     raise CoilWriteException(f"Heatpump denied writing {coil.name}")
                 else:
-                    logger.info(f"Write succeeded for {coil.name}")
+                    logger.info("Write succeeded for %s", coil.name)
             except asyncio.TimeoutError:
                 raise CoilWriteTimeoutException(
                     f"Timeout waiting for write feedback for {coil.name}"
@@ -164,16 +148,49 @@ class NibeGW(asyncio.DatagramProtocol, Connection):
     def error_received(self, exc):
         logger.error(exc)
 
-    def _on_raw_coil_value(self, coil_address: int, raw_value: bytes):
+    def _on_modbus_data_msg(self, data):
+        values = {row.coil_address: row.value for row in data}
+        values.pop(65535, None)  # 0xffff
+        get_coil_by_address = self._heatpump.get_coil_by_address
+        on_coil_raw_value = self._on_coil_raw_value
+        for coil_address in sorted(values):
+            raw_value = values.pop(coil_address, None)
+            if raw_value is None:
+                continue
+
+            try:
+                coil = get_coil_by_address(coil_address)
+                if coil.size in ("u32", "s32"):
+                    raw_value += values.pop(coil_address + 1, b"")
+                on_coil_raw_value(coil, raw_value)
+            except NibeException as e:
+                logger.error(str(e))
+
+    def _on_modbus_read_resp(self, data):
         try:
-            coil = self._heatpump.get_coil_by_address(coil_address)
-        except CoilNotFoundException:
-            if coil_address == 65535:  # 0xffff
-                return
+            self._on_raw_coil_value(data.coil_address, data.value)
+            with suppress(InvalidStateError, CancelledError, AttributeError):
+                self._read_future.set_result(None)
+        except NibeException as e:
+            with suppress(InvalidStateError, CancelledError, AttributeError):
+                self._read_future.set_exception(CoilReadException(str(e), e))
             raise
 
+    def _on_modbus_write_resp(self, data):
+        with suppress(InvalidStateError, CancelledError, AttributeError):
+            self._write_future.set_result(data.result)
+
+    def _on_raw_coil_value(self, coil_address: int, raw_value: bytes):
+        if coil_address == 65535:  # 0xffff
+            return
+
+        self._on_coil_raw_value(
+            self._heatpump.get_coil_by_address(coil_address), raw_value
+        )
+
+    def _on_coil_raw_value(self, coil: Coil, raw_value: bytes):
         coil.raw_value = raw_value
-        logger.info(f"{coil.name}: {coil.value}")
+        logger.info("%s: %s", coil.name, coil.value)
         self._heatpump.notify_coil_update(coil)
 
     async def stop(self):
@@ -194,7 +211,12 @@ class Dedupe5C(Subconstruct):
         self.name = subcon.name
 
     def _parse(self, stream, context, path):
-        unescaped = stream.getvalue().replace(b"\x5c\x5c", b"\x5c")
+        raw = stream.getvalue()
+        if b"\x5c\x5c" not in raw:
+            context.length = len(raw)
+            return self.subcon._parsereport(stream, context, path)
+
+        unescaped = raw.replace(b"\x5c\x5c", b"\x5c")
         context.length = len(unescaped)
         with BytesIO(unescaped) as stream2:
             obj = self.subcon._parsereport(stream2, context, path)
@@ -208,15 +230,29 @@ class Dedupe5C(Subconstruct):
         return obj
 
 
+data_row_struct = PyStruct("<H2s")
+
+
+class DataRows(Adapter):
+    def _decode(self, obj, context, path):
+        obj = obj[: len(obj) - len(obj) % data_row_struct.size]
+        return ListContainer(
+            Container(coil_address=coil_address, value=value)
+            for coil_address, value in data_row_struct.iter_unpack(obj)
+        )
+
+    def _encode(self, obj, context, path):
+        return b"".join(
+            data_row_struct.pack(row.coil_address, row.value) for row in obj
+        )
+
+
 Data = Dedupe5C(
     Switch(
         this.cmd,
         {
             "MODBUS_READ_RESP": Struct("coil_address" / Int16ul, "value" / Bytes(4)),
-            "MODBUS_DATA_MSG": Array(
-                lambda this: this.length // 4,
-                Struct("coil_address" / Int16ul, "value" / Bytes(2)),
-            ),
+            "MODBUS_DATA_MSG": DataRows(GreedyBytes),
             "MODBUS_WRITE_RESP": Struct("result" / Flag),
         },
         default=Bytes(this.length),
@@ -283,3 +319,20 @@ WriteRequest = Struct(
     "checksum" / Checksum(Int8ub, xor8, this.fields.data),
 ).compile()
 # fmt: on
+
+
+read_request_struct = PyStruct("<BBBH")
+
+
+@lru_cache(maxsize=4096)
+def build_read_request(coil_address: int) -> bytes:
+    data = read_request_struct.pack(0xC0, 0x69, 0x02, coil_address)
+    return data + bytes((xor8(data),))
+
+
+write_request_struct = PyStruct("<BBBH4s")
+
+
+def build_write_request(coil_address: int, value: bytes) -> bytes:
+    data = write_request_struct.pack(0xC0, 0x6B, 0x06, coil_address, value)
+    return data + bytes((xor8(data),))
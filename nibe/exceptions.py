@@ -14,6 +14,10 @@ class EncodeException(NibeException):
     pass
 
 
+class ValidationException(NibeException):
+    pass
+
+
 class CoilWriteException(NibeException):
     pass
 
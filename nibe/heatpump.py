@@ -2,6 +2,7 @@ import json
 import logging
 from collections import defaultdict
 from enum import Enum
+from functools import lru_cache
 from importlib.resources import files
 from typing import Any, Callable, Dict, Union
 
@@ -11,6 +12,11 @@ from nibe.exceptions import CoilNotFoundException
 logger = logging.getLogger("nibe").getChild(__name__)
 
 
+@lru_cache(maxsize=None)
+def _load_coil_data(data_file: str) -> dict:
+    return json.loads(files("nibe.data").joinpath(f"{data_file}.json").read_text())
+
+
 class Model(Enum):
     F1155 = "f1155_f1255"
     F1255 = "f1155_f1255"
@@ -49,7 +55,7 @@ class HeatPump:
     COIL_UPDATE_EVENT = "coil_update"
 
     _listeners: defaultdict[Any, list[Callable[..., None]]]
-    _address_to_coil: Dict[str, Coil]
+    _address_to_coil: Dict[int, Coil]
     _name_to_coil: Dict[str, Coil]
 
     def __init__(self, model: Model):
@@ -59,9 +65,11 @@ class HeatPump:
         self._listeners = defaultdict(list)
 
     def _load_coils(self):
-        data = self.model.get_coil_data()
+        data = _load_coil_data(self.model.value)
 
-        self._address_to_coil = {k: Coil(address=int(k), **v) for k, v in data.items()}
+        self._address_to_coil = {
+            int(k): Coil(address=int(k), **v) for k, v in data.items()
+        }
         self._name_to_coil = {c.name: c for _, c in self._address_to_coil.items()}
 
     def initialize(self):
@@ -69,8 +77,10 @@ class HeatPump:
 
     def get_coil_by_address(self, address: Union[int, str]) -> Coil:
         try:
-            return self._address_to_coil[str(address)]
-        except KeyError:
+            if isinstance(address, str):
+                address = int(address)
+            return self._address_to_coil[address]
+        except (KeyError, TypeError, ValueError):
             raise CoilNotFoundException(f"Coil with address {address} not found")
 
     def get_coil_by_name(self, name: str) -> Coil:
@@ -0,0 +1,160 @@
+import asyncio
+from unittest import TestCase
+from unittest.mock import AsyncMock, Mock, patch
+
+from nibe.coil import Coil
+from nibe.connection.modbus import MAX_REGISTERS_PER_READ, Modbus, split_read_blocks
+from nibe.exceptions import DecodeException
+from nibe.heatpump import HeatPump, Model
+
+
+def create_coil(address, size="u16", **kwargs):
+    return Coil(address, f"coil-{address}", f"Coil {address}", size, **kwargs)
+
+
+class TestSplitReadBlocks(TestCase):
+    def test_contiguous(self):
+        coils = [create_coil(102), create_coil(100), create_coil(101)]
+
+        blocks = split_read_blocks(coils)
+
+        self.assertEqual([[100, 101, 102]], [[c.address for c in b] for b in blocks])
+
+    def test_split_at_gap(self):
+        coils = [create_coil(100), create_coil(101), create_coil(103)]
+
+        blocks = split_read_blocks(coils)
+
+        self.assertEqual([[100, 101], [103]], [[c.address for c in b] for b in blocks])
+
+    def test_32bit_coil_spans_two_registers(self):
+        coils = [create_coil(100, "u32"), create_coil(102), create_coil(104, "s32")]
+
+        blocks = split_read_blocks(coils)
+
+        self.assertEqual([[100, 102], [104]], [[c.address for c in b] for b in blocks])
+
+    def test_split_at_register_limit(self):
+        coils = [create_coil(address) for address in range(130)]
+
+        blocks = split_read_blocks(coils)
+
+        self.assertEqual([MAX_REGISTERS_PER_READ, 5], [len(b) for b in blocks])
+
+    def test_split_32bit_coil_at_register_limit(self):
+        coils = [create_coil(address) for address in range(124)]
+        coils.append(create_coil(124, "u32"))
+
+        blocks = split_read_blocks(coils)
+
+        self.assertEqual([124, 1], [len(b) for b in blocks])
+        self.assertEqual(124, blocks[1][0].address)
+
+
+class TestModbus(TestCase):
+    def setUp(self) -> None:
+        self.loop = asyncio.get_event_loop_policy().get_event_loop()
+
+        self.heatpump = HeatPump(Model.F1255)
+        self.heatpump.initialize()
+        self.on_coil_update = Mock()
+        self.heatpump.subscribe(HeatPump.COIL_UPDATE_EVENT, self.on_coil_update)
+
+        self.client = Mock()
+        self.client.read_input_registers = AsyncMock()
+        self.client.write_register = AsyncMock(return_value=1)
+        self.client.write_registers = AsyncMock(return_value=2)
+
+        with patch("nibe.connection.modbus.modbus_for_url", return_value=self.client):
+            self.modbus = Modbus(self.heatpump, "tcp://127.0.0.1:502", 1)
+
+    def test_read_coil(self):
+        coil = create_coil(40004, "s16", factor=10)
+        self.client.read_input_registers.return_value = [150]
+
+        self.loop.run_until_complete(self.modbus.read_coil(coil))
+
+        self.assertEqual(15.0, coil.value)
+        self.client.read_input_registers.assert_awaited_once_with(
+            slave_id=1, starting_address=40004, quantity=1
+        )
+        self.on_coil_update.assert_called_once_with(coil)
+
+    def test_read_coils_with_32bit_coil_at_block_end(self):
+        a = create_coil(100, "s16", factor=10)
+        b = create_coil(101, "u32")
+        self.client.read_input_registers.return_value = [0xFFF6, 0x1234, 0x0001]
+
+        result = self.loop.run_until_complete(self.modbus.read_coils([b, a]))
+
+        self.assertEqual([b, a], result)
+        self.assertEqual(-1.0, a.value)
+        self.assertEqual(0x11234, b.value)
+        self.client.read_input_registers.assert_awaited_once_with(
+            slave_id=1, starting_address=100, quantity=3
+        )
+
+    def test_read_coils_per_block(self):
+        a = create_coil(100)
+        b = create_coil(101, "s32")
+        c = create_coil(200)
+        self.client.read_input_registers.side_effect = [[1, 0xFFFE, 0xFFFF], [3]]
+
+        self.loop.run_until_complete(self.modbus.read_coils([c, b, a]))
+
+        self.assertEqual(1, a.value)
+        self.assertEqual(-2, b.value)
+        self.assertEqual(3, c.value)
+        self.assertEqual(
+            [(100, 3), (200, 1)],
+            [
+                (call.kwargs["starting_address"], call.kwargs["quantity"])
+                for call in self.client.read_input_registers.await_args_list
+            ],
+        )
+
+    def test_read_coils_decode_exception(self):
+        a = create_coil(100, max=10)
+        b = create_coil(101)
+        c = create_coil(200)
+        self.client.read_input_registers.side_effect = [[20, 2], [3]]
+
+        with self.assertRaises(DecodeException):
+            self.loop.run_until_complete(self.modbus.read_coils([a, b, c]))
+
+        self.assertIsNone(a.value)
+        self.assertEqual(2, b.value)
+        self.assertEqual(3, c.value)
+        self.assertEqual(2, self.on_coil_update.call_count)
+
+    def test_write_coil(self):
+        coil = create_coil(100, "s16", write=True)
+        coil.value = -2
+
+        self.loop.run_until_complete(self.modbus.write_coil(coil))
+
+        self.client.write_register.assert_awaited_once_with(
+            slave_id=1, address=100, value=0xFFFE
+        )
+        self.client.write_registers.assert_not_awaited()
+
+    def test_write_negative_8bit_coil(self):
+        coil = self.heatpump.get_coil_by_address(47011)
+        coil.value = -2
+
+        self.loop.run_until_complete(self.modbus.write_coil(coil))
+
+        self.client.write_register.assert_awaited_once_with(
+            slave_id=1, address=47011, value=0xFFFE
+        )
+
+    def test_write_32bit_coil(self):
+        coil = create_coil(100, "u32", write=True)
+        coil.value = 0x11234
+
+        self.loop.run_until_complete(self.modbus.write_coil(coil))
+
+        self.client.write_registers.assert_awaited_once_with(
+            slave_id=1, starting_address=100, values=(0x1234, 0x0001)
+        )
+        self.client.write_register.assert_not_awaited()
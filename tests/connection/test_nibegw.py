@@ -38,6 +38,58 @@ class TestNibeGW(TestCase):
             binascii.unhexlify("c06902a0a9a2"), ("127.0.0.1", 9999)
         )
 
+    def test_read_coils(self):
+        coils = [
+            self.heatpump.get_coil_by_address(43424),
+            self.heatpump.get_coil_by_address(40004),
+        ]
+
+        async def send_receive():
+            task = self.loop.create_task(self.nibegw.read_coils(coils))
+            await asyncio.sleep(0)
+            self.nibegw.datagram_received(
+                binascii.unhexlify("5c00206a06a0a9f5120000a2"), ("127.0.0.1", 12345)
+            )
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            self.nibegw.datagram_received(
+                binascii.unhexlify("5c00206a06449c9600000002"), ("127.0.0.1", 12345)
+            )
+
+            return await task
+
+        result = self.loop.run_until_complete(send_receive())
+        self.assertEqual(coils, result)
+        self.assertEqual(4853, coils[0].value)
+        self.assertEqual(15.0, coils[1].value)
+
+    def test_data_message(self):
+        self.heatpump.get_coil_by_address = Mock(
+            wraps=self.heatpump.get_coil_by_address
+        )
+
+        self.nibegw.datagram_received(
+            binascii.unhexlify(
+                "5c00206851449c2500489cfc004c9cf1004e9cc7014d9c0b024f9c2500509c3300519c0b01529c5c5c01569c3100c9af000001a80c01fda716fafaa9070098a91b1bffff0000a0a9ca02ffff00009ca99212ffff0000be"
+            ),
+            ("127.0.0.1", 12345),
+        )
+
+        self.assertEqual(3.7, self.heatpump.get_coil_by_address(40004).value)
+        self.assertNotIn(
+            65535,
+            [args[0] for args, _ in self.heatpump.get_coil_by_address.call_args_list],
+        )
+
+    def test_data_message_32bit_coil(self):
+        self.nibegw.datagram_received(
+            binascii.unhexlify("5c0020680c449c960098a9341299a901002c"),
+            ("127.0.0.1", 12345),
+        )
+
+        self.assertEqual(15.0, self.heatpump.get_coil_by_address(40004).value)
+        self.assertEqual(0x11234, self.heatpump.get_coil_by_address(43416).value)
+
     def test_read_coil_decode_exception(self):
         coil = self.heatpump.get_coil_by_address(43086)
 
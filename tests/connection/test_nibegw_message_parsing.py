@@ -3,7 +3,8 @@ import unittest
 
 from construct import ChecksumError, Int16sl, Int32ul
 
-from nibe.connection.nibegw import ReadRequest, Response, WriteRequest
+from nibe.connection.nibegw import (ReadRequest, Response, WriteRequest,
+                                    build_read_request, build_write_request,)
 
 
 class MessageResponseParsingTestCase(unittest.TestCase):
@@ -127,6 +128,21 @@ class MessageReadRequestParsingTestCase(unittest.TestCase):
 
         self.assertEqual(binascii.hexlify(raw), b"c069023930a2")
 
+    def test_build_read_request(self):
+        raw = build_read_request(12345)
+
+        self.assertEqual(binascii.hexlify(raw), b"c069023930a2")
+        self.assertIs(raw, build_read_request(12345))
+
+    def test_build_read_request_matches_struct(self):
+        for coil_address in (0, 40004, 43086, 48132, 0x5C5C, 0xFFFF):
+            self.assertEqual(
+                ReadRequest.build(
+                    dict(fields=dict(value=dict(coil_address=coil_address)))
+                ),
+                build_read_request(coil_address),
+            )
+
 
 class MessageWriteRequestParsingTestCase(unittest.TestCase):
     def test_parse_read_request(self):
@@ -138,6 +154,23 @@ class MessageWriteRequestParsingTestCase(unittest.TestCase):
 
         self.assertEqual(binascii.hexlify(raw), b"c06b06393006120f00bf")
 
+    def test_build_write_request(self):
+        raw = build_write_request(12345, Int32ul.build(987654))
+
+        self.assertEqual(binascii.hexlify(raw), b"c06b06393006120f00bf")
+
+    def test_build_write_request_matches_struct(self):
+        for coil_address, value in (
+            (48132, b"\x04\x00\x00\x00"),
+            (0x5C5C, b"\x5c\x00\x00\x00"),
+            (0xFFFF, b"\xff\xff\xff\xff"),
+        ):
+            request = dict(coil_address=coil_address, value=value)
+            self.assertEqual(
+                WriteRequest.build(dict(fields=dict(value=request))),
+                build_write_request(coil_address, value),
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,13 @@
+import copy
+import gc
+import pickle
+from types import MappingProxyType
 from unittest import TestCase
 
 from construct import Int8ul
 
 from nibe.coil import Coil
-from nibe.exceptions import DecodeException, EncodeException
+from nibe.exceptions import DecodeException, EncodeException, ValidationException
 
 
 class TestCoil(TestCase):
@@ -13,8 +17,58 @@ class TestCoil(TestCase):
         self.assertEqual(coil.address, 123)
         self.assertEqual(coil.name, "test_name")
         self.assertEqual(coil.title, "test_title")
+        self.assertEqual(coil.size, "u8")
         self.assertEqual(coil.parser, Int8ul)
         self.assertEqual(coil.other["unknown"], "some other")
+        self.assertIsInstance(coil.other, dict)
+
+    def test_no_reference_cycles(self):
+        gc.collect()
+        gc.disable()
+        try:
+            Coil(123, "test_name", "test_title", "u8")
+            Coil(123, "test_name", "test_title", "u8", factor=10, min=0, max=100)
+            Coil(123, "test_name", "test_title", "u8", mappings={"10": "Off"})
+
+            self.assertEqual(0, gc.collect())
+        finally:
+            gc.enable()
+
+    def test_create_with_unknown_size(self):
+        with self.assertRaises(ValueError):
+            Coil(123, "test_name", "test_title", "u64")
+
+    def test_pickle_and_deepcopy(self):
+        scaled = Coil(
+            123, "scaled", "Scaled", "s16", factor=10, min=-100, max=100, unit="C"
+        )
+        scaled.value = -2.5
+        mapped = Coil(124, "mapped", "Mapped", "u8", mappings={"10": "Off"}, write=True)
+        mapped.value = "off"
+
+        for coil in (scaled, mapped):
+            for restored in (pickle.loads(pickle.dumps(coil)), copy.deepcopy(coil)):
+                self.assertIsNot(coil, restored)
+                self.assertEqual(coil.address, restored.address)
+                self.assertEqual(coil.name, restored.name)
+                self.assertEqual(coil.size, restored.size)
+                self.assertEqual(coil.factor, restored.factor)
+                self.assertEqual(coil.unit, restored.unit)
+                self.assertEqual(coil.is_writable, restored.is_writable)
+                self.assertEqual(coil.mappings, restored.mappings)
+                self.assertEqual(dict(coil.other), dict(restored.other))
+                self.assertEqual(coil.value, restored.value)
+                self.assertEqual(coil.raw_value, restored.raw_value)
+
+    def test_slots(self):
+        coil = Coil(123, "test_name", "test_title", "u8")
+
+        self.assertFalse(hasattr(coil, "__dict__"))
+        self.assertEqual({}, coil.other)
+        self.assertIsInstance(coil.other, MappingProxyType)
+        self.assertIs(coil.other, copy.deepcopy(coil).other)
+        with self.assertRaises(AttributeError):
+            coil.unknown_attribute = 1
 
 
 class TestCoilUnsigned8(TestCase):
@@ -58,14 +112,15 @@ class TestCoilSigned16(TestCase):
         self.coil.value = 5.0
         self.coil.value = 30
 
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(ValidationException):
             self.coil.value = 4.9
 
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(ValidationException):
             self.coil.value = 30.1
 
     def test_decode(self):
         self.coil.raw_value = b"\x97\x00"
+        self.assertEqual(15.1, self.coil.value)
 
     def test_decode_out_of_bounds(self):
         with self.assertRaises(DecodeException):
@@ -74,18 +129,31 @@ class TestCoilSigned16(TestCase):
         with self.assertRaises(DecodeException):
             self.coil.raw_value = b"\x2d\x10"
 
+    def test_decode_too_short(self):
+        with self.assertRaises(DecodeException):
+            self.coil.raw_value = b"\x97"
+
     def test_encode(self):
         self.coil.value = 15.1
         self.assertEqual(b"\x97\x00\x00\x00", self.coil.raw_value)
 
     def test_encode_out_of_bounds(self):
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(ValidationException):
             self.coil.value = 4
 
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(ValidationException):
             self.coil.value = 30.1
 
 
+class TestCoilFactor100(TestCase):
+    def setUp(self) -> None:
+        self.coil = Coil(123, "test", "test", "u16", factor=100)
+
+    def test_encode_rounds_to_nearest(self):
+        self.coil.value = 0.29
+        self.assertEqual(b"\x1d\x00\x00\x00", self.coil.raw_value)
+
+
 class TestCoilWithMapping(TestCase):
     def setUp(self) -> None:
         self.coil = Coil(
@@ -111,7 +179,7 @@ class TestCoilWithMapping(TestCase):
         self.assertEqual("OFF", self.coil.value)
 
     def test_set_invalid_value(self):
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(ValidationException):
             self.coil.value = "Beer"
 
     def test_decode_mapping(self):
@@ -126,8 +194,29 @@ class TestCoilWithMapping(TestCase):
         with self.assertRaises(DecodeException):
             self.coil.raw_value = b"\x00"
 
+    def test_mappings_are_shared(self):
+        other = Coil(124, "other", "Other", "u8", mappings={"10": "Off", "20": "On"})
+        another = Coil(
+            125, "another", "Another", "u8", mappings={"10": "Off", "20": "On"}
+        )
+
+        self.assertIs(other._mappings_int, another._mappings_int)
+        self.assertIs(other._reverse_mappings_int, another._reverse_mappings_int)
+        with self.assertRaises(TypeError):
+            other._mappings_int[30] = "HEAT"
+
+        self.assertIsInstance(other.mappings, dict)
+        other.mappings["30"] = "HEAT"
+        self.assertEqual({"10": "OFF", "20": "ON"}, another.mappings)
+
+    def test_decode_after_set_mappings(self):
+        self.coil.set_mappings({"10": "Low", "20": "High"})
+
+        self.coil.raw_value = b"\x14"
+        self.assertEqual("HIGH", self.coil.value)
+
     def test_encode_mapping_failure(self):
-        with self.assertRaises(AssertionError):
+        with self.assertRaises(ValidationException):
             self.coil.value = "Unknown"
 
 
@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import Mock
 
 from nibe.exceptions import CoilNotFoundException
-from nibe.heatpump import HeatPump, Model
+from nibe.heatpump import HeatPump, Model, _load_coil_data
 
 
 class HeatpumpTestCase(unittest.TestCase):
@@ -26,10 +26,32 @@ class HeatpumpTestCase(unittest.TestCase):
 
         self.assertIs(a, c)
 
+    def test_coil_data_is_loaded_once(self):
+        self.assertIs(
+            _load_coil_data(Model.F1155.value), _load_coil_data(Model.F1255.value)
+        )
+
+        Model.F1255.get_coil_data().clear()
+
+        heat_pump = HeatPump(Model.F1155)
+        heat_pump.initialize()
+
+        a = heat_pump.get_coil_by_address(40004)
+        b = self.heat_pump.get_coil_by_address(40004)
+
+        self.assertIsNot(a, b)
+
     def test_get_missing_coil_raises_exception(self):
         with self.assertRaises(CoilNotFoundException):
             self.heat_pump.get_coil_by_address(0xFFFF)
 
+        with self.assertRaises(CoilNotFoundException):
+            self.heat_pump.get_coil_by_address("no-beer-today")
+
+        for address in (None, 40004.7, b"40004", [40004]):
+            with self.assertRaises(CoilNotFoundException):
+                self.heat_pump.get_coil_by_address(address)
+
         with self.assertRaises(CoilNotFoundException):
             self.heat_pump.get_coil_by_name("no-beer-today")
 